@@ -2,6 +2,7 @@ import logging
 from typing import List
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.models import CronJob
 from app.services.local_cron_reader import get_local_cron_jobs
@@ -12,6 +13,8 @@ logging.basicConfig(level=logging.INFO)
 app = FastAPI(
     title="CronFleet API",
     version="0.1.0",
+    # orjson serialisiert (u.a. datetime in next_runs) in C statt über das stdlib json-Modul
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -20,7 +23,9 @@ async def health():
     return {"status": "ok"}
 
 
+# Bewusst kein async: get_local_cron_jobs blockiert (Dateien, subprocess, croniter).
+# Sync-Handler führt FastAPI im Threadpool aus, der Event-Loop bleibt frei.
 @app.get("/crons/local", response_model=List[CronJob])
-async def list_local_crons():
+def list_local_crons():
     return get_local_cron_jobs()
 
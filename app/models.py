@@ -1,10 +1,13 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CronJob(BaseModel):
+    # Unveränderlich: Jobs werden fertig gebaut (inkl. next_runs) und danach nur noch ausgeliefert
+    model_config = ConfigDict(frozen=True)
+
     id: str
     system: str
     user: str
@@ -1,16 +1,43 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Final, Optional
 
+# Zeilen, die kein Cronjob sind: leer, Kommentar (#) oder ENV-Assignment (KEY=VALUE).
+# Ein einziger C-Level Match statt strip/startswith/split/isalnum in Python.
+_SKIP_RE: Final = re.compile(r"^\s*(?:#|$|[A-Za-z_]\w*\s*=)")
 
-@dataclass(frozen=True)
+# Schnellcheck vor den Zeilen-Regexen: Cron-Zeilen beginnen mit einem Special (@...) oder
+# einem Minutenfeld (Ziffer oder *). Gruppe 1 gesetzt = Special, damit wird nur einer der
+# beiden Zeilen-Regexe probiert. Zeilen mit anderem Anfang (z.B. "H * * * * root cmd")
+# gelten damit als nicht parsebar: sie werden nicht als Job gelistet, nur mit Warning geloggt.
+_LIKELY_CRON_LINE: Final = re.compile(r"\s*(?:(@)|[0-9*])")
+
+# Cron-Zeilen als ein einziger Regex-Match statt split()/join() in Python.
+# Standard: 5 Zeitfelder (einzeln, damit die Schedule normalisiert mit " " gejoint wird),
+# danach ggf. user, Rest = command (ohne führende/abschließende Whitespaces).
+_SYSTEM_LINE_RE: Final = re.compile(r"\s*([^\s@]\S*)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(.*\S)")
+_SYSTEM_SPECIAL_RE: Final = re.compile(r"\s*(@\S+)\s+(\S+)\s+(.*\S)")
+_USER_LINE_RE: Final = re.compile(r"\s*([^\s@]\S*)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(.*\S)")
+_USER_SPECIAL_RE: Final = re.compile(r"\s*(@\S+)\s+(.*\S)")
+
+
+@dataclass(frozen=True, slots=True)
 class ParsedCronLine:
     schedule: str
     user: str
     command: str
 
 
+def is_ignorable_line(line: str) -> bool:
+    """
+    True für leere Zeilen, Kommentare und ENV-Assignments (PATH=..., MAILTO=...).
+    Solche Zeilen dürfen ohne Warning übersprungen werden.
+    """
+    return _SKIP_RE.match(line) is not None
+
+
 def parse_system_cron_line(line: str) -> Optional[ParsedCronLine]:
     """
     Parser für System-Cron-Dateien wie /etc/crontab und /etc/cron.d/*.
@@ -24,33 +51,24 @@ def parse_system_cron_line(line: str) -> Optional[ParsedCronLine]:
     - leere Zeilen, Kommentare
     - einfache ENV-Zeilen wie PATH=..., SHELL=...
     """
-    raw = line.strip()
-    if not raw or raw.startswith("#"):
-        return None
-
-    parts = raw.split()
-
-    # ENV-Zeilen (typisch: KEY=VALUE)
-    if len(parts) == 1 and "=" in parts[0]:
+    # Leerzeilen, Kommentare, ENV-Zeilen (und sonstiger Müll) scheitern hier schon
+    likely = _LIKELY_CRON_LINE.match(line)
+    if not likely:
         return None
 
     # @reboot / @daily etc.: "@daily root /path/to/cmd"
-    if parts[0].startswith("@"):
-        if len(parts) < 3:
+    if likely.group(1):
+        m = _SYSTEM_SPECIAL_RE.match(line)
+        if not m:
             return None
-        schedule = parts[0]
-        user = parts[1]
-        command = " ".join(parts[2:])
-        return ParsedCronLine(schedule=schedule, user=user, command=command)
+        return ParsedCronLine(schedule=m.group(1), user=m.group(2), command=m.group(3))
 
     # Standard: 5 Felder + user + command
-    if len(parts) < 7:
+    m = _SYSTEM_LINE_RE.match(line)
+    if not m:
         return None
 
-    schedule = " ".join(parts[0:5])
-    user = parts[5]
-    command = " ".join(parts[6:])
-    return ParsedCronLine(schedule=schedule, user=user, command=command)
+    return ParsedCronLine(schedule=" ".join(m.group(1, 2, 3, 4, 5)), user=m.group(6), command=m.group(7))
 
 
 def parse_user_cron_line(line: str) -> Optional[ParsedCronLine]:
@@ -61,33 +79,21 @@ def parse_user_cron_line(line: str) -> Optional[ParsedCronLine]:
       - Specials: @daily/@weekly/@reboot/... command...
     Ignores empty lines, comments and simple ENV assignments (KEY=VALUE).
     """
-    raw = line.strip()
-    if not raw or raw.startswith("#"):
-        return None
-
-    # ENV lines like PATH=..., MAILTO=..., SHELL=...
-    if "=" in raw:
-        key = raw.split("=", 1)[0].strip()
-        if key and all(ch.isalnum() or ch == "_" for ch in key):
-            return None
-
-    parts = raw.split()
-    if not parts:
+    # Empty lines, comments and ENV lines like PATH=..., MAILTO=..., SHELL=... fail here
+    likely = _LIKELY_CRON_LINE.match(line)
+    if not likely:
         return None
 
     # Specials like @daily
-    if parts[0].startswith("@"):
-        if len(parts) < 2:
+    if likely.group(1):
+        m = _USER_SPECIAL_RE.match(line)
+        if not m:
             return None
-        schedule = parts[0]
-        command = " ".join(parts[1:])
-        return ParsedCronLine(schedule=schedule, user="", command=command)
+        return ParsedCronLine(schedule=m.group(1), user="", command=m.group(2))
 
     # Standard: 5 time fields + command...
-    if len(parts) < 6:
+    m = _USER_LINE_RE.match(line)
+    if not m:
         return None
 
-    schedule = " ".join(parts[:5])
-    command = " ".join(parts[5:])
-    return ParsedCronLine(schedule=schedule, user="", command=command)
-
+    return ParsedCronLine(schedule=" ".join(m.group(1, 2, 3, 4, 5)), user="", command=m.group(6))
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import calendar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+# Wie weit maximal in die Zukunft gesucht wird (z.B. "0 0 30 2 *" matcht nie).
+# Gleicher Wert wie croniters Default für max_years_between_matches.
+MAX_YEARS_BETWEEN_MATCHES = 50
+
+# Specials, die sich 1:1 auf eine 5-Feld-Expression abbilden lassen.
+# @reboot fehlt absichtlich: dafür gibt es keinen berechenbaren Zeitpunkt.
+_SPECIALS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+# (min, max) je Feld: minute, hour, day-of-month, month, day-of-week
+_FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+_MONTH_NAMES = {name.lower(): i for i, name in enumerate(calendar.month_abbr) if name}
+_DOW_NAMES = {"sun": 0, "mon": 1, "tue": 2, "wed": 3, "thu": 4, "fri": 5, "sat": 6}
+
+# 5 Kopien eines 7-Bit-Musters (Bits 0, 7, 14, 21, 28): Wochenmuster -> Tage 1..35
+_REPEAT_WEEKLY = 0x10204081
+
+
+@dataclass(frozen=True)
+class CronSpec:
+    """
+    Vorab geparste 5-Feld Cron-Expression: pro Feld eine Bitmaske der erlaubten Werte
+    (Bit n gesetzt = Wert n erlaubt). Membership ist damit `(mask >> n) & 1`, und
+    "kleinster erlaubter Wert >= n" eine Maskenoperation (siehe _next_allowed).
+    dows nutzt die Cron-Zählung (0 = Sonntag, 7 wird auf 0 normalisiert).
+    """
+
+    minutes: int
+    hours: int
+    doms: int
+    months: int
+    dows: int
+    # True: Tag matcht, wenn day-of-month ODER day-of-week passt (klassische Cron-Semantik,
+    # wenn beide Felder eingeschränkt sind). False: beide müssen passen.
+    day_or: bool
+
+    def _allowed_days(self, year: int, month: int) -> int:
+        """Bitmaske der passenden Tage (Bit 1..31) im gegebenen Monat."""
+        # Wochentag des 1. in Cron-Zählung (datetime: Montag = 0 -> Cron: Montag = 1, Sonntag = 0)
+        first_dow, days_in_month = calendar.monthrange(year, month)
+        first_dow = (first_dow + 1) % 7
+
+        # Bit i im rotierten Muster: Wochentag (first_dow + i) % 7 ist erlaubt.
+        # Fünfmal wiederholt und um 1 verschoben -> Bit d für Tag d.
+        week = ((self.dows >> first_dow) | (self.dows << (7 - first_dow))) & 0x7F
+        dow_days = (week * _REPEAT_WEEKLY) << 1
+
+        days = (self.doms | dow_days) if self.day_or else (self.doms & dow_days)
+        return days & ((1 << (days_in_month + 1)) - 2)
+
+    def next_after(self, after: datetime) -> datetime:
+        """
+        Nächster Zeitpunkt strikt nach `after`.
+
+        Hierarchische Suche Jahr -> Monat -> Tag -> Stunde -> Minute: pro Ebene wird direkt
+        zum nächsten erlaubten Wert gesprungen, statt Minute für Minute weiterzuzählen.
+        Bereits passende äußere Felder bleiben erhalten; nur wenn eine Ebene überläuft,
+        wird die nächsthöhere weitergeschaltet und die inneren Felder auf ihr Minimum gesetzt.
+        """
+        t = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        year, month, day, hour, minute = t.year, t.month, t.day, t.hour, t.minute
+        last_year = after.year + MAX_YEARS_BETWEEN_MATCHES
+
+        while year <= last_year:
+            m = _next_allowed(self.months, month)
+            if m is None:
+                year, month, day, hour, minute = year + 1, 1, 1, 0, 0
+                continue
+            if m != month:
+                month, day, hour, minute = m, 1, 0, 0
+
+            d = _next_allowed(self._allowed_days(year, month), day)
+            if d is None:
+                month, day, hour, minute = month + 1, 1, 0, 0
+                if month > 12:
+                    year, month = year + 1, 1
+                continue
+            if d != day:
+                day, hour, minute = d, 0, 0
+
+            h = _next_allowed(self.hours, hour)
+            if h is None:
+                # Überlauf: nächster Tag (ggf. läuft die Tagessuche oben in den nächsten Monat)
+                day, hour, minute = day + 1, 0, 0
+                continue
+            if h != hour:
+                hour, minute = h, 0
+
+            mi = _next_allowed(self.minutes, minute)
+            if mi is None:
+                hour, minute = hour + 1, 0
+                continue
+
+            return datetime(year, month, day, hour, mi)
+
+        raise ValueError(f"no match within {MAX_YEARS_BETWEEN_MATCHES} years")
+
+
+def _next_allowed(mask: int, current: int) -> Optional[int]:
+    """
+    Kleinster erlaubter Wert >= current, oder None (Überlauf in die nächsthöhere Ebene).
+    Bits unterhalb von current löschen, dann das niedrigste gesetzte Bit isolieren.
+    """
+    rest = mask >> current << current
+    if not rest:
+        return None
+    return (rest & -rest).bit_length() - 1
+
+
+def _parse_value(token: str, names: dict) -> Optional[int]:
+    # Nur ASCII-Ziffern: str.isdigit() akzeptiert auch "²" oder "٣" (keine Cron-Syntax,
+    # int("²") würde sogar werfen). Solche Felder -> None, croniter entscheidet.
+    if token.isascii() and token.isdigit():
+        return int(token)
+    return names.get(token.lower())
+
+
+def _parse_field(field: str, index: int) -> Optional[int]:
+    """
+    Parst ein einzelnes Cron-Feld (Listen, Ranges, Steps, Monats-/Wochentagsnamen) in eine Bitmaske.
+    Alles, was darüber hinausgeht (L, W, #, ?, umgekehrte Ranges, ...) -> None.
+    """
+    lo, hi = _FIELD_RANGES[index]
+    names = _MONTH_NAMES if index == 3 else _DOW_NAMES if index == 4 else {}
+    mask = 0
+
+    for item in field.split(","):
+        base, sep, step_str = item.partition("/")
+        if sep:
+            if not (step_str.isascii() and step_str.isdigit()) or int(step_str) == 0:
+                return None
+            step = int(step_str)
+        else:
+            step = 1
+
+        if base == "*":
+            start, end = lo, hi
+        elif "-" in base:
+            a, _, b = base.partition("-")
+            start, end = _parse_value(a, names), _parse_value(b, names)
+            if start is None or end is None or start > end:
+                return None
+        else:
+            start = _parse_value(base, names)
+            if start is None:
+                return None
+            # "5/15" bedeutet (wie bei croniter) "5-max/15". Beim Wochentag endet croniter
+            # dabei bei 6 (Samstag), nicht bei 7: "5/2" ist nur Freitag, nicht Freitag + Sonntag.
+            end = (6 if index == 4 else hi) if sep else start
+            if start > end:
+                # z.B. "7/2" beim Wochentag: Sonderfall, den croniter eigenwillig auslegt
+                return None
+
+        if start < lo or end > hi:
+            return None
+        for value in range(start, end + 1, step):
+            mask |= 1 << value
+
+    return mask
+
+
+def parse_schedule(schedule: str) -> Optional[CronSpec]:
+    """
+    Parst eine 5-Feld Cron-Expression (oder ein äquivalentes Special wie @daily).
+
+    Gibt None zurück, wenn die Expression nicht sicher unterstützt wird. Der Aufrufer
+    fällt dann auf croniter zurück, das auch ungültige Expressions bewertet.
+
+    Bewusste Abweichungen von croniter (hier gilt die Cron-Semantik):
+    - Einwertige Ranges ("4-4", bzw. "23/2" = "23-23/2") bleiben der eine Wert;
+      croniter macht daraus "*".
+    - Sind dom und dow eingeschränkt und der Tag existiert im Monat nie ("0 0 31 11 6"),
+      greift trotzdem das ODER: es gibt Läufe an den passenden Wochentagen.
+      croniter liefert dafür keine.
+    """
+    s = (schedule or "").strip()
+    s = _SPECIALS.get(s.lower(), s)
+    fields = s.split()
+    if len(fields) != 5:
+        return None
+
+    parsed = []
+    for index, field in enumerate(fields):
+        mask = _parse_field(field, index)
+        if mask is None:
+            return None
+        parsed.append(mask)
+
+    minutes, hours, doms, months, dows = parsed
+    dom_field, dow_field = fields[2], fields[4]
+
+    # dom/dow: Ist eines der Felder "*", müssen beide passen (das "*"-Feld matcht immer).
+    # Enthält keines ein "*", reicht eines (klassische Cron-Semantik).
+    # Mischformen wie "*/2" überlasse ich croniter, das dort eigene Regeln hat.
+    if dom_field == "*" or dow_field == "*":
+        day_or = False
+    elif "*" not in dom_field and "*" not in dow_field:
+        day_or = True
+    else:
+        return None
+
+    # Sonntag als 7 -> Bit 0
+    dows = (dows | (dows >> 7)) & 0x7F
+
+    return CronSpec(minutes=minutes, hours=hours, doms=doms, months=months, dows=dows, day_or=day_or)
+
+
+def next_fire(schedule: str, after: datetime) -> datetime:
+    """
+    Nächster Ausführungszeitpunkt strikt nach `after`.
+    Wirft ValueError, wenn die Expression nicht unterstützt wird oder nie matcht.
+    """
+    spec = parse_schedule(schedule)
+    if spec is None:
+        raise ValueError(f"unsupported cron expression: {schedule!r}")
+    return spec.next_after(after)
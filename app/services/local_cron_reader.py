@@ -1,32 +1,298 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+import functools
 import getpass
+import hashlib
 import logging
+import operator
 import os
+import re
+import stat
 import subprocess
+import threading
+import time
 
 from app.models import CronJob
-from app.services.cron_parsing import parse_system_cron_line, parse_user_cron_line
+from app.services.cron_parsing import (
+    ParsedCronLine,
+    is_ignorable_line,
+    parse_system_cron_line,
+    parse_user_cron_line,
+)
 from app.services.schedule import compute_next_runs
 
 logger = logging.getLogger(__name__)
 
+# Lokale System-Cron-Quellen
+_CRON_D = Path("/etc/cron.d")
+_CRONTAB = Path("/etc/crontab")
+_CRON_HOURLY = Path("/etc/cron.hourly")
+
+# Argumente eines run-parts Aufrufs bis zum Ende des Teil-Commands (; & | oder schließende Klammer,
+# z.B. Debians "test -x ... || ( cd / && run-parts --report /etc/cron.daily )") bzw. bis zur
+# ersten Umleitung inkl. fd-Nummer ("2>&1", "2>/dev/null", "< /dev/null").
+_RUN_PARTS_ARGS_RE = re.compile(r"\brun-parts\s+((?:(?!\d*[<>])[^;&|<>)])*)")
+
+# Deterministische Sortierung für die API-Ausgabe (macht Smoke-Checks und Diffs reproduzierbar).
+# JobTemplate-Felder sind immer str, ein (x or "") pro Feld ist daher nicht nötig.
+_JOB_SORT_KEY = operator.attrgetter("system", "source", "user", "schedule", "command", "id")
+
+# cron.* Verzeichnisse, deren Skripte einzeln gelistet werden (Aggregatoren dafür werden ausgeblendet)
+_RUN_PARTS_TARGETS = ("/etc/cron.hourly", "/etc/cron.daily", "/etc/cron.weekly", "/etc/cron.monthly")
+
+# Opt-in Flags (siehe README). Werden einmal beim Import gelesen,
+# Änderungen erfordern einen Neustart des API-Prozesses.
+_INCLUDE_RUN_PARTS = os.getenv("CRONFLEET_INCLUDE_RUN_PARTS", "0") == "1"
+_INCLUDE_ROOT_CRONTAB = os.getenv("CRONFLEET_INCLUDE_ROOT_CRONTAB", "0") == "1"
+
+
+def _resolve_current_user() -> str:
+    """
+    User des API-Prozesses über getpass (Env-Vars / passwd).
+    Darf beim Import nicht werfen: in Containern mit zufälliger UID gibt es oft weder
+    passwd-Eintrag noch USER/LOGNAME, dann wird die numerische UID verwendet.
+    """
+    try:
+        return getpass.getuser()
+    except (KeyError, OSError):
+        return str(os.geteuid())
+
+
+# User (und effektive UID) des API-Prozesses. Ändern sich während der Laufzeit nicht,
+# daher nur einmal beim Import ermitteln.
+_CURRENT_USER = _resolve_current_user()
+_EUID = os.geteuid()
+
+# Obergrenze für externe Commands (crontab -l, sudo -n crontab -l)
+_COMMAND_TIMEOUT_SECONDS = 5.0
+
 # Verhindert, dass die gleiche sudo-Warnung bei jedem Request gespammt wird
 _WARNED_ROOT_SUDO_FAILED = False
 
+# Nach einem fehlgeschlagenen `sudo -n` (z.B. kein NOPASSWD) wird sudo für diese Zeit
+# gar nicht erst gestartet: spart fork/exec + PAM pro Request.
+_ROOT_SUDO_RETRY_SECONDS = 300.0
+_ROOT_SUDO_BLOCKED_UNTIL = 0.0
+
+# Template-Cache für get_local_cron_jobs: gültig, solange sich der Fingerprint der
+# Cron-Quellen nicht ändert und der Eintrag jünger als _CACHE_MAX_AGE_SECONDS ist.
+# Das Alter begrenzt, wie lange eine nicht per stat erkennbare User-Crontab
+# (Fallback `crontab -l`) veralten kann. next_runs wird nie gecacht, sondern pro Request berechnet.
+_CACHE_MAX_AGE_SECONDS = 60.0
+_cache_lock = threading.Lock()
+_cache_templates: Optional[List["JobTemplate"]] = None
+_cache_fingerprint: Optional[bytes] = None
+_cache_ts = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class JobTemplate:
+    """
+    Alles, was einen lokalen Cronjob ausmacht, außer next_runs.
+    Hängt nur vom Inhalt der Cron-Quellen ab (nicht von der Uhrzeit) und kann daher
+    gecacht werden; CronJobs entstehen daraus pro Request in LocalCronReader.build_jobs.
+    """
+
+    id: str
+    system: str
+    user: str
+    schedule: str
+    command: str
+    source: str
+    description: str
+
+
+# Dummy-Daten für die frühe Entwicklung. Hängen nur vom User des Prozesses ab,
+# werden daher einmal beim Import gebaut.
+_DUMMY_TEMPLATES = (
+    JobTemplate(
+        id="local-root-system-update",
+        system="localhost",
+        user="root",
+        schedule="0 3 * * *",
+        command="/usr/bin/pacman -Syu --noconfirm",
+        source="dummy",
+        description="Beispiel: nächtliches System-Update (Dummy-Daten).",
+    ),
+    JobTemplate(
+        id="local-user-backup-home",
+        system="localhost",
+        user=_CURRENT_USER,
+        schedule="30 2 * * 1-5",
+        command=f"/home/{_CURRENT_USER}/bin/backup-home.sh",
+        source="dummy",
+        description="Beispiel: User-Backup des Home-Verzeichnisses (Dummy-Daten).",
+    ),
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _compute_next_runs_cached(schedule: str, start: datetime, count: int) -> Tuple[datetime, ...]:
+    """
+    Memoisiert compute_next_runs pro (Schedule, Startminute, count).
+    `start` muss auf die Minute abgerundet sein, sonst trifft der Cache nie.
+    Viele Jobs teilen sich dieselbe Schedule (z.B. alle Skripte aus /etc/cron.hourly),
+    innerhalb derselben Minute wird die Cron-Expression so nur einmal ausgewertet.
+    Tuple statt Liste, damit der gecachte Wert nicht von außen verändert werden kann.
+    """
+    return tuple(compute_next_runs(schedule, start=start, count=count))
+
+
+# Datei-Reads über den Thread-Pool erst ab dieser Anzahl, darunter lohnt der Overhead nicht
+_PARALLEL_READ_MIN_FILES = 3
+
+
+@functools.lru_cache(maxsize=1)
+def _io_pool() -> ThreadPoolExecutor:
+    """
+    Prozessweiter Thread-Pool für Datei-Reads, erst beim ersten Bedarf erzeugt.
+    Spart Start/Stop der Worker-Threads bei jedem Scan.
+    """
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="cronfleet-io")
+
 
 def _run_command(cmd: list[str]) -> tuple[int, str, str]:
     """
     Führt einen Command aus und liefert (returncode, stdout, stderr).
     Wirft keine Exception bei non-zero Exit Codes.
+
+    stdin ist /dev/null (kein Erben des Server-stdin, keine hängenden Prompts) und nach
+    _COMMAND_TIMEOUT_SECONDS wird abgebrochen (rc=124 wie bei timeout(1)), damit ein
+    blockierendes sudo/PAM den API-Worker nicht dauerhaft festhält.
     """
     try:
-        p = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        p = subprocess.run(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=_COMMAND_TIMEOUT_SECONDS,
+            check=False,
+        )
         return p.returncode, p.stdout or "", p.stderr or ""
     except FileNotFoundError:
         logger.warning("command not found: %s", cmd[0])
         return 127, "", f"command not found: {cmd[0]}"
+    except subprocess.TimeoutExpired:
+        logger.warning("command timed out after %ss: %s", _COMMAND_TIMEOUT_SECONDS, " ".join(cmd))
+        return 124, "", f"timed out after {_COMMAND_TIMEOUT_SECONDS}s"
+
+
+def _is_executable_file(entry: os.DirEntry) -> bool:
+    """
+    True für reguläre, ausführbare Dateien (Symlinks werden aufgelöst).
+
+    Ein einziges stat() liefert Typ und Modus. Ohne x-Bit ist die Datei sicher nicht
+    ausführbar; als root reicht irgendein x-Bit, bei eigenen Dateien das Owner-Bit.
+    Nur bei fremden Dateien entscheidet os.access (Gruppenzugehörigkeit, ACLs).
+    """
+    try:
+        st = entry.stat()
+    except OSError:
+        return False
+    if not stat.S_ISREG(st.st_mode) or not st.st_mode & 0o111:
+        return False
+    if _EUID == 0:
+        return True
+    if st.st_uid == _EUID:
+        return bool(st.st_mode & stat.S_IXUSR)
+    return os.access(entry.path, os.X_OK)
+
+
+def _run_parts_dirs(command: str) -> List[str]:
+    """
+    Ziel-Verzeichnisse aller run-parts Aufrufe in einem Command (ohne abschließendes '/').
+
+    Das Verzeichnis ist das letzte Argument, das keine Option ist: damit passen auch
+    'run-parts -v <dir>', 'run-parts -- <dir>' und 'run-parts --regex <pattern> <dir>'.
+    Einzige Quelle für Schedule-Ableitung und Ausblenden der Aggregatoren,
+    damit beide immer dasselbe Ziel sehen.
+    """
+    if "run-parts" not in command:
+        return []
+
+    dirs: List[str] = []
+    for m in _RUN_PARTS_ARGS_RE.finditer(command):
+        args = [arg for arg in m.group(1).split() if not arg.startswith("-")]
+        if args:
+            dirs.append(args[-1].rstrip("/") or "/")
+    return dirs
+
+
+def _parse_system_cron_file(path: Path, kind: str) -> List[Tuple[int, ParsedCronLine]]:
+    """
+    Liest eine System-Cron-Datei (/etc/crontab, /etc/cron.d/*) zeilenweise und parst sie.
+
+    Die Datei wird direkt vom File-Handle gestreamt (kein read_text().splitlines()),
+    d.h. weder der komplette Inhalt noch eine Zeilenliste wird vorab im Speicher aufgebaut.
+    Lesefehler und nicht parsebare Zeilen: Warning, der Rest der Datei bleibt verwertbar.
+    """
+    entries: List[Tuple[int, ParsedCronLine]] = []
+    try:
+        with path.open("r", encoding="utf-8", errors="replace") as fh:
+            for lineno, line in enumerate(fh, start=1):
+                # Kommentare/Leerzeilen/ENV-Zeilen (meist die Mehrheit) gar nicht erst parsen
+                if is_ignorable_line(line):
+                    continue
+                parsed = parse_system_cron_line(line)
+                if not parsed:
+                    logger.warning("failed to parse system %s line: %s:%s: %s", kind, path, lineno, line.strip())
+                    continue
+                entries.append((lineno, parsed))
+    except OSError as e:
+        logger.warning("failed to read %s: %s", path, e)
+    return entries
+
+
+# Ablageorte der User-Crontabs: cronie (RHEL/Arch/Fedora) bzw. Debian/Ubuntu
+_USER_SPOOL_DIRS = (Path("/var/spool/cron"), Path("/var/spool/cron/crontabs"))
+
+# Debian schreibt diesen Header in die Spool-Datei; `crontab -l` blendet ihn aus.
+_DEBIAN_SPOOL_HEADER = "# DO NOT EDIT THIS FILE"
+_DEBIAN_SPOOL_HEADER_LINES = 3
+
+
+def _open_spool_crontab(username: str) -> Optional[Iterator[str]]:
+    """
+    Öffnet die Crontab eines Users direkt im Cron-Spool.
+
+    Liefert einen Zeilen-Iterator wie `crontab -l` (ohne Debian-Header, damit die
+    Zeilennummern und damit die Job-IDs identisch bleiben) oder None, wenn keine
+    Spool-Datei lesbar ist. Dann muss der Aufrufer auf `crontab -l` zurückfallen.
+    """
+    for spool_dir in _USER_SPOOL_DIRS:
+        path = spool_dir / username
+        try:
+            fh = path.open("r", encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        return _iter_spool_lines(path, fh)
+
+    return None
+
+
+def _iter_spool_lines(path: Path, fh: TextIO) -> Iterator[str]:
+    """
+    Streamt die Zeilen einer geöffneten Spool-Datei (kein read_text().splitlines()) und
+    schließt sie am Ende. Lesefehler mittendrin: Warning, bis dahin gelesene Zeilen bleiben.
+    """
+    with fh:
+        try:
+            first = fh.readline()
+            if first.startswith(_DEBIAN_SPOOL_HEADER):
+                for _ in range(_DEBIAN_SPOOL_HEADER_LINES - 1):
+                    fh.readline()
+            elif first:
+                yield first
+            yield from fh
+        except OSError as e:
+            logger.warning("failed to read %s: %s", path, e)
 
 
 class LocalCronReader:
@@ -49,42 +315,67 @@ class LocalCronReader:
     Milestone 3 (Qualität):
     - deterministische Sortierung der Ausgabe
     - robustes Fehlerverhalten: keine API-Crashes, klare Warnings
+
+    Die Quellen liefern JobTemplates (ohne next_runs, siehe get_job_templates).
+    build_jobs macht daraus CronJobs: next_runs gebündelt pro Schedule, CronJob per
+    model_construct (ohne Pydantic-Validierung), da alle Felder aus den eigenen Parsern
+    kommen und bereits die richtigen Typen haben.
     """
 
-    def _job_sort_key(self, job: CronJob) -> tuple[str, str, str, str, str, str]:
+    def __init__(self) -> None:
+        # Einmaliger Scan über /etc/cron.d/* und /etc/crontab (siehe _scan_system_cron).
+        # _infer_schedule_from_run_parts, _read_cron_d_jobs und _read_etc_crontab_jobs
+        # arbeiten danach nur noch auf diesen Listen, statt die Dateien erneut zu lesen.
+        self._cron_d_parsed: Optional[List[Tuple[str, int, ParsedCronLine]]] = None
+        self._etc_crontab_parsed: List[Tuple[int, ParsedCronLine]] = []
+        self._run_parts_index: Optional[Dict[str, Tuple[str, str]]] = None
+
+    def _parse_cron_d_files(self) -> List[Tuple[Path, List[Tuple[int, ParsedCronLine]]]]:
         """
-        Deterministische Sortierung für die API-Ausgabe.
-        Das macht Smoke-Checks und spätere Tests/Diffs reproduzierbar.
+        Liest und parst alle Dateien aus /etc/cron.d (sortiert).
+
+        Die Dateien laufen parallel im prozessweiten Thread-Pool (_io_pool), jeder Worker
+        streamt sein eigenes File-Handle: bei kaltem Page-Cache sind das latenzgebundene
+        Syscalls, während derer der GIL freigegeben ist. Bei nur ein, zwei Dateien wird
+        direkt im aufrufenden Thread gelesen.
         """
-        return (
-            (job.system or ""),
-            (job.source or ""),
-            (job.user or ""),
-            (job.schedule or ""),
-            (job.command or ""),
-            (job.id or ""),
-        )
+        if not _CRON_D.is_dir():
+            return []
+
+        # DirEntry.is_file() ohne extra stat; sortiert wird einmal über die Namen
+        with os.scandir(_CRON_D) as it:
+            entries = sorted((entry for entry in it if entry.is_file()), key=lambda e: e.name)
+        files = [Path(entry.path) for entry in entries]
+
+        def parse(path: Path) -> Tuple[Path, List[Tuple[int, ParsedCronLine]]]:
+            return path, _parse_system_cron_file(path, "cron.d")
 
-    def _is_ignorable_line(self, line: str) -> bool:
+        if len(files) < _PARALLEL_READ_MIN_FILES:
+            return [parse(p) for p in files]
+        return list(_io_pool().map(parse, files))
+
+    def _scan_system_cron(self) -> List[Tuple[str, int, ParsedCronLine]]:
         """
-        True, wenn eine Zeile typischerweise kein Cronjob ist (und deshalb ohne Warning ignoriert werden darf):
-        - leer
-        - Kommentar (#)
-        - ENV-Assignment (z.B. PATH=/usr/bin)
+        Liest und parst /etc/cron.d/* und /etc/crontab in einem einzigen Durchgang.
+
+        Ergebnis (auf der Instanz gecacht):
+        - self._cron_d_parsed: (Dateiname, lineno, ParsedCronLine) für /etc/cron.d/*
+        - self._etc_crontab_parsed: (lineno, ParsedCronLine) für /etc/crontab
+        Nicht parsebare Zeilen werden dabei (einmal) geloggt.
         """
-        s = line.strip()
-        if not s:
-            return True
-        if s.startswith("#"):
-            return True
-
-        # ENV-Assignments: in /etc/crontab und user crontab erlaubt
-        # Typisch: "SHELL=/bin/sh", "PATH=/usr/bin:/bin"
-        first = s.split()[0]
-        if "=" in first and not first.startswith("@"):
-            return True
+        if self._cron_d_parsed is not None:
+            return self._cron_d_parsed
 
-        return False
+        self._cron_d_parsed = [
+            (file.name, lineno, parsed)
+            for file, entries in self._parse_cron_d_files()
+            for lineno, parsed in entries
+        ]
+
+        if _CRONTAB.is_file():
+            self._etc_crontab_parsed = _parse_system_cron_file(_CRONTAB, "crontab")
+
+        return self._cron_d_parsed
 
     def _safe_next_runs(self, schedule: str, now: datetime, context: str) -> List[datetime]:
         """
@@ -97,7 +388,7 @@ class LocalCronReader:
             return []
 
         try:
-            runs = compute_next_runs(s, start=now, count=3)
+            runs = list(_compute_next_runs_cached(s, now, 3))
         except Exception as e:
             logger.warning("failed to compute next_runs for %s (schedule=%r): %s", context, s, e)
             return []
@@ -109,140 +400,136 @@ class LocalCronReader:
 
         return runs
 
-    def _is_run_parts_for_dir(self, command: str, target_dir: str) -> bool:
-        c = command.strip()
-        return ("run-parts" in c) and (target_dir in c)
+    def _build_run_parts_index(self) -> Dict[str, Tuple[str, str]]:
+        """
+        Sammelt in einem Durchgang alle 'run-parts <dir>' Einträge aus den System-Cron-Quellen.
+
+        Rückgabe: {target_dir: (schedule, where)}, z.B.
+          {"/etc/cron.hourly": ("01 * * * *", "/etc/cron.d/0hourly:5")}
+        Reihenfolge wie bisher: /etc/cron.d/* vor /etc/crontab, der erste Treffer gewinnt.
+        Auf der Instanz gecacht, weitere Lookups (hourly/daily/...) sind reine Dict-Zugriffe.
+        """
+        if self._run_parts_index is not None:
+            return self._run_parts_index
+
+        cron_d_parsed = self._scan_system_cron()
+        sources = chain(
+            ((f"/etc/cron.d/{name}", lineno, parsed) for name, lineno, parsed in cron_d_parsed),
+            ((str(_CRONTAB), lineno, parsed) for lineno, parsed in self._etc_crontab_parsed),
+        )
+
+        index: Dict[str, Tuple[str, str]] = {}
+        for path, lineno, parsed in sources:
+            for target in _run_parts_dirs(parsed.command):
+                index.setdefault(target, (parsed.schedule, f"{path}:{lineno}"))
+
+        self._run_parts_index = index
+        return index
 
     def _infer_schedule_from_run_parts(self, target_dir: str) -> Tuple[str, str]:
         """
         Versucht eine Schedule für ein cron.* Verzeichnis (z.B. /etc/cron.hourly) zu finden,
-        indem System-Cron-Quellen nach einem 'run-parts <target_dir>' Eintrag durchsucht werden.
+        über den 'run-parts <target_dir>' Eintrag aus _build_run_parts_index.
 
         Rückgabe: (schedule, where)
           - schedule: Cron-Expression (oder Special)
           - where: Fundstelle wie "/etc/cron.d/0hourly:5" oder "default"
         """
-        # 1) /etc/cron.d/*
-        cron_d_dir = Path("/etc/cron.d")
-        if cron_d_dir.is_dir():
-            for file in sorted(cron_d_dir.iterdir()):
-                if not file.is_file():
-                    continue
-                try:
-                    lines = file.read_text(encoding="utf-8", errors="replace").splitlines()
-                except OSError:
-                    continue
-
-                for lineno, line in enumerate(lines, start=1):
-                    parsed = parse_system_cron_line(line)
-                    if not parsed:
-                        continue
-                    if self._is_run_parts_for_dir(parsed.command, target_dir):
-                        return parsed.schedule, f"/etc/cron.d/{file.name}:{lineno}"
-
-        # 2) /etc/crontab
-        path = Path("/etc/crontab")
-        if path.is_file():
-            try:
-                lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-            except OSError:
-                lines = []
-
-            for lineno, line in enumerate(lines, start=1):
-                parsed = parse_system_cron_line(line)
-                if not parsed:
-                    continue
-                if self._is_run_parts_for_dir(parsed.command, target_dir):
-                    return parsed.schedule, f"/etc/crontab:{lineno}"
-
         # Fallback
-        return "0 * * * *", "default"
-
-    def _get_current_user_crontab_jobs(self, now: datetime) -> List[CronJob]:
-        username = getpass.getuser()
-        rc, out, err = _run_command(["crontab", "-l"])
-
-        # Kein crontab ist ok -> einfach leer zurück
-        if rc != 0:
-            msg = (err or out).lower()
-            if rc == 127 or "no crontab for" in msg:
-                return []
-            logger.warning("crontab -l failed (rc=%s): %s", rc, (err or out).strip())
-            return []
-
-        jobs: List[CronJob] = []
+        return self._build_run_parts_index().get(target_dir, ("0 * * * *", "default"))
+
+    def _get_current_user_crontab_jobs(self) -> Iterator[JobTemplate]:
+        username = _CURRENT_USER
+
+        # Schneller Weg: Spool-Datei direkt lesen (kein fork/exec von crontab)
+        lines: Optional[Iterable[str]] = _open_spool_crontab(username)
+        origin = "spool"
+        if lines is None:
+            origin = "crontab -l"
+            rc, out, err = _run_command(["crontab", "-l"])
+
+            # Kein crontab ist ok -> einfach leer zurück
+            if rc != 0:
+                msg = (err or out).lower()
+                if rc == 127 or "no crontab for" in msg:
+                    return
+                logger.warning("crontab -l failed (rc=%s): %s", rc, (err or out).strip())
+                return
+            lines = out.splitlines()
 
-        for lineno, line in enumerate(out.splitlines(), start=1):
+        for lineno, line in enumerate(lines, start=1):
+            if is_ignorable_line(line):
+                continue
             parsed = parse_user_cron_line(line)
             if not parsed:
-                if not self._is_ignorable_line(line):
-                    logger.warning("failed to parse user crontab line: %s:%s: %s", username, lineno, line.strip())
+                logger.warning("failed to parse user crontab line: %s:%s: %s", username, lineno, line.strip())
                 continue
 
             job_id = f"user-crontab:{username}:{lineno}"
-            jobs.append(
-                CronJob(
-                    id=job_id,
-                    system="localhost",
-                    user=username,
-                    schedule=parsed.schedule,
-                    command=parsed.command,
-                    next_runs=self._safe_next_runs(parsed.schedule, now=now, context=job_id),
-                    source="user-crontab",
-                    description="Quelle: user crontab (crontab -l)",
-                )
+            yield JobTemplate(
+                id=job_id,
+                system="localhost",
+                user=username,
+                schedule=parsed.schedule,
+                command=parsed.command,
+                source="user-crontab",
+                description=f"Quelle: user crontab ({origin})",
             )
 
-        return jobs
-
-    def _get_root_crontab_jobs(self, now: datetime) -> List[CronJob]:
+    def _get_root_crontab_jobs(self) -> Iterator[JobTemplate]:
         """
-        Optional: root crontab via `sudo -n crontab -l`.
+        Optional: root crontab, bevorzugt direkt aus dem Cron-Spool (läuft die API als root
+        oder ist die Datei lesbar), sonst via `sudo -n crontab -l`.
         -n sorgt dafür, dass sudo NICHT nach einem Passwort fragt (API bleibt responsiv).
+        Schlägt sudo fehl, wird es für _ROOT_SUDO_RETRY_SECONDS nicht erneut versucht.
         """
-        global _WARNED_ROOT_SUDO_FAILED
-
-        rc, out, err = _run_command(["sudo", "-n", "crontab", "-l"])
-
-        if rc != 0:
-            msg = (err or out).lower()
-            if "no crontab for" in msg:
-                return []
-
-            if not _WARNED_ROOT_SUDO_FAILED:
-                logger.warning(
-                    "sudo -n crontab -l failed (rc=%s): %s",
-                    rc,
-                    (err or out).strip(),
-                )
-                _WARNED_ROOT_SUDO_FAILED = True
-            return []
-
-        jobs: List[CronJob] = []
+        global _WARNED_ROOT_SUDO_FAILED, _ROOT_SUDO_BLOCKED_UNTIL
+
+        # Schneller Weg: Spool-Datei direkt lesen; sudo nur, wenn sie nicht lesbar ist
+        lines: Optional[Iterable[str]] = _open_spool_crontab("root")
+        origin = "spool"
+        if lines is None:
+            origin = "sudo -n crontab -l"
+            if time.monotonic() < _ROOT_SUDO_BLOCKED_UNTIL:
+                return
+
+            rc, out, err = _run_command(["sudo", "-n", "crontab", "-l"])
+
+            if rc != 0:
+                msg = (err or out).lower()
+                if "no crontab for" in msg:
+                    return
+
+                if not _WARNED_ROOT_SUDO_FAILED:
+                    logger.warning(
+                        "sudo -n crontab -l failed (rc=%s): %s",
+                        rc,
+                        (err or out).strip(),
+                    )
+                    _WARNED_ROOT_SUDO_FAILED = True
+                _ROOT_SUDO_BLOCKED_UNTIL = time.monotonic() + _ROOT_SUDO_RETRY_SECONDS
+                return
+            lines = out.splitlines()
 
-        for lineno, line in enumerate(out.splitlines(), start=1):
+        for lineno, line in enumerate(lines, start=1):
+            if is_ignorable_line(line):
+                continue
             parsed = parse_user_cron_line(line)
             if not parsed:
-                if not self._is_ignorable_line(line):
-                    logger.warning("failed to parse root crontab line: root:%s: %s", lineno, line.strip())
+                logger.warning("failed to parse root crontab line: root:%s: %s", lineno, line.strip())
                 continue
 
             job_id = f"user-crontab:root:{lineno}"
-            jobs.append(
-                CronJob(
-                    id=job_id,
-                    system="localhost",
-                    user="root",
-                    schedule=parsed.schedule,
-                    command=parsed.command,
-                    next_runs=self._safe_next_runs(parsed.schedule, now=now, context=job_id),
-                    source="root-crontab",
-                    description="Quelle: root user crontab (sudo -n crontab -l)",
-                )
+            yield JobTemplate(
+                id=job_id,
+                system="localhost",
+                user="root",
+                schedule=parsed.schedule,
+                command=parsed.command,
+                source="root-crontab",
+                description=f"Quelle: root user crontab ({origin})",
             )
 
-        return jobs
-
     def _should_hide_run_parts_aggregator(self, command: str) -> bool:
         """
         Blendet run-parts Aggregatoren aus (z.B. '01 * * * * run-parts /etc/cron.hourly'),
@@ -250,81 +537,104 @@ class LocalCronReader:
 
         Mit CRONFLEET_INCLUDE_RUN_PARTS=1 bleibt alles sichtbar.
         """
-        if os.getenv("CRONFLEET_INCLUDE_RUN_PARTS", "0") == "1":
+        if _INCLUDE_RUN_PARTS:
             return False
 
-        if "run-parts" not in command:
-            return False
+        return any(target in _RUN_PARTS_TARGETS for target in _run_parts_dirs(command))
 
-        targets = ("/etc/cron.hourly", "/etc/cron.daily", "/etc/cron.weekly", "/etc/cron.monthly")
-        return any(t in command for t in targets)
+    def _dummy_jobs(self) -> Iterator[JobTemplate]:
+        return iter(_DUMMY_TEMPLATES)
 
-    def get_cron_jobs(self) -> List[CronJob]:
-        now = datetime.now()
-        current_user = getpass.getuser()
-
-        jobs: List[CronJob] = [
-            CronJob(
-                id="local-root-system-update",
-                system="localhost",
-                user="root",
-                schedule="0 3 * * *",
-                command="/usr/bin/pacman -Syu --noconfirm",
-                next_runs=self._safe_next_runs("0 3 * * *", now=now, context="dummy:local-root-system-update"),
-                source="dummy",
-                description="Beispiel: nächtliches System-Update (Dummy-Daten).",
-            ),
-            CronJob(
-                id="local-user-backup-home",
-                system="localhost",
-                user=current_user,
-                schedule="30 2 * * 1-5",
-                command=f"/home/{current_user}/bin/backup-home.sh",
-                next_runs=self._safe_next_runs("30 2 * * 1-5", now=now, context="dummy:local-user-backup-home"),
-                source="dummy",
-                description="Beispiel: User-Backup des Home-Verzeichnisses (Dummy-Daten).",
-            ),
+    def get_job_templates(self) -> List[JobTemplate]:
+        """
+        Liest alle Quellen und liefert die gefilterten, sortierten JobTemplates.
+        Das ist der teure Teil (Datei-I/O, Parsing, ggf. `crontab -l`), aber unabhängig von der Uhrzeit.
+        """
+        sources: List[Iterable[JobTemplate]] = [
+            self._dummy_jobs(),
+            # User crontab (aktueller User)
+            self._get_current_user_crontab_jobs(),
         ]
 
-        # User crontab (aktueller User)
-        jobs.extend(self._get_current_user_crontab_jobs(now=now))
-
         # Optional: root crontab (opt-in)
-        if os.getenv("CRONFLEET_INCLUDE_ROOT_CRONTAB", "0") == "1":
-            jobs.extend(self._get_root_crontab_jobs(now=now))
-
-        # Lokale Quellen
-        jobs.extend(self._read_cron_hourly_jobs(now=now))
-        jobs.extend(self._read_etc_crontab_jobs(now=now))
-        jobs.extend(self._read_cron_d_jobs(now=now))
-
-        # Dedup/Anzeige: run-parts Aggregatoren standardmäßig ausblenden
-        jobs = [j for j in jobs if not self._should_hide_run_parts_aggregator(j.command)]
-
-        # Milestone 3: deterministische Reihenfolge für /crons/local
-        jobs.sort(key=self._job_sort_key)
+        if _INCLUDE_ROOT_CRONTAB:
+            sources.append(self._get_root_crontab_jobs())
+
+        # Lokale Quellen. Mit sichtbaren Aggregatoren steht 'run-parts /etc/cron.hourly' bereits
+        # für die Einzelskripte; die werden dann nicht zusätzlich gelistet (und gar nicht erst gelesen).
+        if not (_INCLUDE_RUN_PARTS and str(_CRON_HOURLY) in self._build_run_parts_index()):
+            sources.append(self._read_cron_hourly_jobs())
+        sources.append(self._read_etc_crontab_jobs())
+        sources.append(self._read_cron_d_jobs())
+
+        # Alle Quellen sind Generatoren: ein Durchlauf, in dem direkt gefiltert
+        # (run-parts Aggregatoren standardmäßig ausblenden) und sortiert wird
+        # (Milestone 3: deterministische Reihenfolge für /crons/local).
+        templates: Iterable[JobTemplate] = chain.from_iterable(sources)
+        if not _INCLUDE_RUN_PARTS:
+            templates = (t for t in templates if not self._should_hide_run_parts_aggregator(t.command))
+
+        # Bewusst sorted() statt heapq.merge über die Quellen: innerhalb einer Quelle ist die
+        # Reihenfolge die der Zeilen, nicht die des Sort-Keys (user/schedule/command). Timsort
+        # nutzt vorsortierte Runs ohnehin aus, und dank Template-Cache läuft das nur nach Änderungen.
+        return sorted(templates, key=_JOB_SORT_KEY)
+
+    def build_jobs(self, templates: Iterable[JobTemplate]) -> List[CronJob]:
+        """
+        Macht aus JobTemplates CronJobs mit aktuellen next_runs (Reihenfolge bleibt erhalten).
+        next_runs wird pro eindeutiger Schedule nur einmal gerechnet
+        (z.B. teilen sich alle /etc/cron.hourly Skripte eine Schedule).
+        """
+        # Einmal pro Request, auf die Minute gerundet (Cron ist minutengenau):
+        # gemeinsamer Startzeitpunkt und Cache-Key für alle next_runs
+        now = datetime.now().replace(second=0, microsecond=0)
+
+        templates = list(templates)
+        by_schedule: Dict[str, List[str]] = defaultdict(list)
+        for t in templates:
+            by_schedule[t.schedule].append(t.id)
+
+        runs_by_schedule = {
+            schedule: self._safe_next_runs(schedule, now=now, context=", ".join(ids))
+            for schedule, ids in by_schedule.items()
+        }
+
+        return [
+            CronJob.model_construct(
+                id=t.id,
+                system=t.system,
+                user=t.user,
+                schedule=t.schedule,
+                command=t.command,
+                next_runs=list(runs_by_schedule[t.schedule]),
+                source=t.source,
+                description=t.description,
+            )
+            for t in templates
+        ]
 
-        return jobs
+    def get_cron_jobs(self) -> List[CronJob]:
+        return self.build_jobs(self.get_job_templates())
 
-    def _read_cron_hourly_jobs(self, now: datetime) -> List[CronJob]:
+    def _read_cron_hourly_jobs(self) -> Iterator[JobTemplate]:
         """
-        Liest Skripte aus /etc/cron.hourly und mappt sie auf CronJob-Objekte.
+        Liest Skripte aus /etc/cron.hourly und mappt sie auf JobTemplates.
 
         Schedule:
         - Wenn ein run-parts Eintrag für /etc/cron.hourly gefunden wird, übernehme ich dessen Schedule.
         - Sonst Fallback: "0 * * * *"
         """
-        cron_hourly_dir = Path("/etc/cron.hourly")
-        if not cron_hourly_dir.is_dir():
-            return []
+        if not _CRON_HOURLY.is_dir():
+            return
 
-        inferred_schedule, inferred_where = self._infer_schedule_from_run_parts("/etc/cron.hourly")
-        jobs: List[CronJob] = []
+        inferred_schedule, inferred_where = self._infer_schedule_from_run_parts(str(_CRON_HOURLY))
 
-        for entry in cron_hourly_dir.iterdir():
-            if not entry.is_file():
-                continue
-            if not os.access(entry, os.X_OK):
+        # Nach Namen sortiert (wie /etc/cron.d): deterministische Reihenfolge, unabhängig vom Dateisystem
+        with os.scandir(_CRON_HOURLY) as it:
+            entries = sorted(it, key=lambda e: e.name)
+
+        for entry in entries:
+            if not _is_executable_file(entry):
                 continue
 
             name = entry.name
@@ -335,104 +645,118 @@ class LocalCronReader:
                 desc = f"Quelle: /etc/cron.hourly (Schedule abgeleitet aus run-parts: {inferred_where})."
 
             job_id = f"cron.hourly-{name}"
-            jobs.append(
-                CronJob(
-                    id=job_id,
-                    system="localhost",
-                    user="root",
-                    schedule=inferred_schedule,
-                    command=str(entry),
-                    next_runs=self._safe_next_runs(inferred_schedule, now=now, context=f"/etc/cron.hourly/{name}"),
-                    source="/etc/cron.hourly",
-                    description=desc,
-                )
+            yield JobTemplate(
+                id=job_id,
+                system="localhost",
+                user="root",
+                schedule=inferred_schedule,
+                command=entry.path,
+                source="/etc/cron.hourly",
+                description=desc,
             )
 
-        return jobs
-
-    def _read_etc_crontab_jobs(self, now: datetime) -> List[CronJob]:
-        path = Path("/etc/crontab")
-        if not path.is_file():
-            return []
-
-        try:
-            lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-        except OSError as e:
-            logger.warning("failed to read /etc/crontab: %s", e)
-            return []
-
-        jobs: List[CronJob] = []
-
-        for lineno, line in enumerate(lines, start=1):
-            parsed = parse_system_cron_line(line)
-            if not parsed:
-                if not self._is_ignorable_line(line):
-                    logger.warning("failed to parse system crontab line: /etc/crontab:%s: %s", lineno, line.strip())
-                continue
+    def _read_etc_crontab_jobs(self) -> Iterator[JobTemplate]:
+        self._scan_system_cron()
 
+        for lineno, parsed in self._etc_crontab_parsed:
             job_id = f"etc-crontab:{lineno}"
-            jobs.append(
-                CronJob(
-                    id=job_id,
-                    system="localhost",
-                    user=parsed.user,
-                    schedule=parsed.schedule,
-                    command=parsed.command,
-                    next_runs=self._safe_next_runs(parsed.schedule, now=now, context=f"/etc/crontab:{lineno}"),
-                    source="/etc/crontab",
-                    description="Quelle: /etc/crontab",
-                )
+            yield JobTemplate(
+                id=job_id,
+                system="localhost",
+                user=parsed.user,
+                schedule=parsed.schedule,
+                command=parsed.command,
+                source="/etc/crontab",
+                description="Quelle: /etc/crontab",
             )
 
-        return jobs
+    def _read_cron_d_jobs(self) -> Iterator[JobTemplate]:
+        for name, lineno, parsed in self._scan_system_cron():
+            job_id = f"cron.d:{name}:{lineno}"
+            yield JobTemplate(
+                id=job_id,
+                system="localhost",
+                user=parsed.user,
+                schedule=parsed.schedule,
+                command=parsed.command,
+                source=f"/etc/cron.d/{name}",
+                description=f"Quelle: /etc/cron.d/{name}",
+            )
 
-    def _read_cron_d_jobs(self, now: datetime) -> List[CronJob]:
-        cron_d_dir = Path("/etc/cron.d")
-        if not cron_d_dir.is_dir():
-            return []
 
-        jobs: List[CronJob] = []
+def _hash_stat(h: "hashlib._Hash", path: str) -> Optional[os.stat_result]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        h.update(f"{path}\0-\n".encode())
+        return None
+    h.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\0{st.st_mode}\n".encode())
+    return st
 
-        for file in sorted(cron_d_dir.iterdir()):
-            if not file.is_file():
-                continue
 
+def _cron_sources_fingerprint() -> bytes:
+    """
+    Fingerprint aller lokalen Cron-Quellen aus reinen stat()-Aufrufen (kein Lesen/Parsen).
+
+    Erfasst (Pfad, mtime_ns, size, mode) von /etc/crontab, den Spool-Dateien des
+    aktuellen Users (und ggf. root) sowie /etc/cron.d und /etc/cron.hourly (Verzeichnis + Einträge via
+    os.scandir). Der Modus ist dabei, weil ein chmod +x in cron.hourly die mtime nicht ändert.
+    """
+    h = hashlib.blake2b(digest_size=16)
+
+    _hash_stat(h, str(_CRONTAB))
+    spool_users = [_CURRENT_USER]
+    if _INCLUDE_ROOT_CRONTAB:
+        spool_users.append("root")
+    for username in spool_users:
+        for spool_dir in _USER_SPOOL_DIRS:
+            _hash_stat(h, str(spool_dir / username))
+
+    for directory in (_CRON_D, _CRON_HOURLY):
+        if _hash_stat(h, str(directory)) is None:
+            continue
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
             try:
-                lines = file.read_text(encoding="utf-8", errors="replace").splitlines()
-            except OSError as e:
-                logger.warning("failed to read %s: %s", file, e)
+                st = entry.stat()
+            except OSError:
                 continue
+            h.update(f"{entry.path}\0{st.st_mtime_ns}\0{st.st_size}\0{st.st_mode}\n".encode())
 
-            for lineno, line in enumerate(lines, start=1):
-                parsed = parse_system_cron_line(line)
-                if not parsed:
-                    if not self._is_ignorable_line(line):
-                        logger.warning(
-                            "failed to parse system cron.d line: /etc/cron.d/%s:%s: %s",
-                            file.name,
-                            lineno,
-                            line.strip(),
-                        )
-                    continue
-
-                job_id = f"cron.d:{file.name}:{lineno}"
-                jobs.append(
-                    CronJob(
-                        id=job_id,
-                        system="localhost",
-                        user=parsed.user,
-                        schedule=parsed.schedule,
-                        command=parsed.command,
-                        next_runs=self._safe_next_runs(parsed.schedule, now=now, context=f"/etc/cron.d/{file.name}:{lineno}"),
-                        source=f"/etc/cron.d/{file.name}",
-                        description=f"Quelle: /etc/cron.d/{file.name}",
-                    )
-                )
-
-        return jobs
+    return h.digest()
 
 
 def get_local_cron_jobs() -> List[CronJob]:
+    """
+    Liefert die lokalen Cronjobs. Die JobTemplates sind gecacht, solange sich die
+    Cron-Quellen nicht ändern; next_runs wird bei jedem Aufruf frisch berechnet.
+
+    Pro Request fallen im Normalfall nur ein paar stat()-Aufrufe an (Fingerprint)
+    plus next_runs pro eindeutiger Schedule; gelesen, geparst und ggf. `crontab -l`
+    gestartet wird erst, wenn sich eine Quelle geändert hat oder der Cache älter als
+    _CACHE_MAX_AGE_SECONDS ist.
+    Der Lock sorgt dafür, dass parallele Requests nicht gleichzeitig neu scannen.
+    """
+    global _cache_templates, _cache_fingerprint, _cache_ts
+
+    # Vor dem Scan berechnet: ändert sich eine Datei währenddessen, passt der
+    # gespeicherte Fingerprint beim nächsten Request nicht mehr -> erneuter Scan.
+    fingerprint = _cron_sources_fingerprint()
     reader = LocalCronReader()
-    return reader.get_cron_jobs()
 
+    with _cache_lock:
+        if (
+            _cache_templates is None
+            or fingerprint != _cache_fingerprint
+            or time.monotonic() - _cache_ts >= _CACHE_MAX_AGE_SECONDS
+        ):
+            _cache_templates = reader.get_job_templates()
+            _cache_fingerprint = fingerprint
+            _cache_ts = time.monotonic()
+        templates = _cache_templates
+
+    return reader.build_jobs(templates)
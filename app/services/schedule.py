@@ -1,10 +1,32 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Union
 
 from croniter import croniter
-from croniter.croniter import CroniterBadCronError, CroniterBadDateError
+from croniter.croniter import CroniterBadDateError
+
+from app.services.fast_cron import CronSpec, parse_schedule
+
+# Marker für Expressions, die croniter ablehnt (z.B. "61 * * * *")
+_INVALID = object()
+
+
+@lru_cache(maxsize=256)
+def _parsed_schedule(schedule: str) -> Union[CronSpec, object, None]:
+    """
+    Parst eine Schedule einmal pro Prozess statt bei jedem compute_next_runs Aufruf.
+
+    Rückgabe:
+    - CronSpec: wird von fast_cron unterstützt
+    - None: gültig, aber nur über croniter berechenbar (z.B. "*/2" in dom/dow, L, #)
+    - _INVALID: ungültig, compute_next_runs liefert direkt []
+    """
+    spec: Optional[CronSpec] = parse_schedule(schedule)
+    if spec is not None:
+        return spec
+    return None if croniter.is_valid(schedule) else _INVALID
 
 
 def compute_next_runs(schedule: str, *, start: datetime, count: int = 3) -> List[datetime]:
@@ -12,10 +34,31 @@ def compute_next_runs(schedule: str, *, start: datetime, count: int = 3) -> List
     Berechnet die nächsten `count` Ausführungszeitpunkte aus einer Cron-Expression.
 
     Aktuell: Fokus auf 5-Feld Cron (min hour dom mon dow).
+    Übliche 5-Feld Expressions (und @daily/@yearly/...) laufen über die hierarchische Suche
+    in fast_cron; alles andere (und tz-aware Startzeiten) weiterhin über croniter.
     Bei Fehlern -> [] (später mit sauberer Fehlerbehandlung).
     """
+    # Ungültige Schedules sind hier schon aussortiert; die except-Zweige unten fangen nur
+    # noch Expressions ab, die gültig sind, aber nie matchen (z.B. "0 0 30 2 *").
+    parsed = _parsed_schedule(schedule)
+    if parsed is _INVALID:
+        return []
+
+    runs: List[datetime] = []
+    if isinstance(parsed, CronSpec) and start.tzinfo is None:
+        t = start
+        try:
+            for _ in range(count):
+                t = parsed.next_after(t)
+                runs.append(t)
+        except ValueError:
+            return []
+        return runs
+
+    it = croniter(schedule, start)
     try:
-        it = croniter(schedule, start)
-        return [it.get_next(datetime) for _ in range(count)]
-    except (CroniterBadCronError, CroniterBadDateError, ValueError):
+        for _ in range(count):
+            runs.append(it.get_next(datetime))
+    except CroniterBadDateError:
         return []
+    return runs
@@ -0,0 +1,31 @@
+import unittest
+from datetime import datetime
+
+from app.services.fast_cron import parse_schedule
+from app.services.schedule import compute_next_runs
+
+START = datetime(2026, 10, 15, 12, 0)
+
+
+class FastCronRegressionTest(unittest.TestCase):
+    def test_non_ascii_digits_are_not_parsed(self):
+        for schedule in ("0 0 ² * *", "٣ * * * *", "*/٣ * * * *"):
+            self.assertIsNone(parse_schedule(schedule), schedule)
+
+    def test_non_ascii_digits_do_not_raise(self):
+        # Vertrag von compute_next_runs: bei Fehlern [] statt Exception
+        self.assertEqual(compute_next_runs("0 0 ² * *", start=START), [])
+
+    def test_dow_step_ends_at_saturday(self):
+        # "5/2" wie bei croniter: nur Freitag, kein Sonntag
+        runs = compute_next_runs("0 0 * * 5/2", start=START)
+        self.assertEqual([r.weekday() for r in runs], [4, 4, 4])
+
+    def test_dom_or_dow_when_dom_never_occurs(self):
+        # Beide Felder eingeschränkt -> ODER: der 31.11. existiert nie, Samstage schon
+        runs = compute_next_runs("0 0 31 11 6", start=START)
+        self.assertEqual(runs[0], datetime(2026, 11, 7, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from app.services.local_cron_reader import _run_parts_dirs
+
+
+class RunPartsDirsTest(unittest.TestCase):
+    def test_plain_and_options(self):
+        cases = {
+            "run-parts /etc/cron.hourly": ["/etc/cron.hourly"],
+            "run-parts /etc/cron.hourly/": ["/etc/cron.hourly"],
+            "run-parts -v /etc/cron.hourly": ["/etc/cron.hourly"],
+            "run-parts -- /etc/cron.hourly": ["/etc/cron.hourly"],
+            "run-parts --report /etc/cron.daily": ["/etc/cron.daily"],
+            "run-parts --regex '^x$' /etc/cron.hourly": ["/etc/cron.hourly"],
+        }
+        for command, expected in cases.items():
+            self.assertEqual(_run_parts_dirs(command), expected, command)
+
+    def test_redirections_are_not_the_directory(self):
+        cases = {
+            "run-parts /etc/cron.hourly 2>&1 | logger -t cron": ["/etc/cron.hourly"],
+            "run-parts /etc/cron.daily 2>/dev/null": ["/etc/cron.daily"],
+            "run-parts /etc/cron.hourly < /dev/null": ["/etc/cron.hourly"],
+            "run-parts /etc/cron.hourly > /dev/null 2>&1": ["/etc/cron.hourly"],
+        }
+        for command, expected in cases.items():
+            self.assertEqual(_run_parts_dirs(command), expected, command)
+
+    def test_compound_commands(self):
+        debian = "test -x /usr/sbin/anacron || ( cd / && run-parts --report /etc/cron.daily )"
+        self.assertEqual(_run_parts_dirs(debian), ["/etc/cron.daily"])
+        self.assertEqual(
+            _run_parts_dirs("/usr/bin/run-parts /etc/cron.weekly; run-parts /etc/cron.monthly"),
+            ["/etc/cron.weekly", "/etc/cron.monthly"],
+        )
+
+    def test_no_run_parts(self):
+        self.assertEqual(_run_parts_dirs("echo hi > /tmp/x"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()